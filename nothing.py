@@ -5,16 +5,102 @@ https://blog.danslimmon.com/2019/07/15/do-nothing-scripting-the-key-to-gradual-a
 """
 
 import abc
-from argparse import ArgumentParser
-from collections.abc import Callable
-from dataclasses import dataclass
-from datetime import datetime
-import json
+import atexit
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cache
 import logging
+import math
+import os
 from pathlib import Path
-from sys import stderr, stdout
+from queue import Empty, SimpleQueue
+import sys
+import threading
 from time import sleep
-from typing import Any, Optional, Self
+from typing import Any, ClassVar, Optional, Self
+
+
+def _contains_non_finite(obj: Any) -> bool:
+    """Return True if ``obj`` contains a NaN or infinite float, at any depth."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_contains_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_non_finite(v) for v in obj)
+    return False
+
+
+@cache
+def _get_json_backend() -> tuple[Callable[[Any, bool], bytes], Callable[[bytes], Any]]:
+    """Return ``(dumps, loads)`` functions for the fastest available JSON library.
+
+    Uses orjson if available, falling back to the standard library. Chosen on
+    first use rather than at import, since importing orjson is comparatively
+    slow. Both backends encode to bytes (compact unless pretty), and raise
+    json.JSONDecodeError on failure.
+    """
+    import json
+
+    def stdlib_dumps(obj: Any, pretty: bool) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    try:
+        import orjson
+    except ImportError:
+        return stdlib_dumps, json.loads
+
+    # Make orjson reject the types that the standard library rejects, rather
+    #  than e.g. saving a datetime that then reloads as a str.
+    base_option = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def orjson_default(obj: Any) -> Any:
+        message = f"Object of type {type(obj).__name__} is not JSON serializable"
+        raise TypeError(message)
+
+    def orjson_dumps(obj: Any, pretty: bool) -> bytes:
+        option = base_option | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            rep = orjson.dumps(obj, default=orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            # Let the standard library decide anything orjson cannot encode,
+            #  e.g. integers beyond 64 bits, non-str dict keys, str subclasses.
+            #  It either encodes the value or raises its usual TypeError.
+            #  Remaining difference: orjson encodes UUID and Enum values.
+            return stdlib_dumps(obj, pretty)
+        # orjson silently writes NaN/Infinity as null, which would reload as
+        #  None. Only search the object if the output contains a null.
+        if b"null" in rep and _contains_non_finite(obj):
+            return stdlib_dumps(obj, pretty)
+        return rep
+
+    def orjson_loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or Infinity, written by the standard library fallback.
+            return json.loads(data)
+
+    return orjson_dumps, orjson_loads
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    return _get_json_backend()[0](obj, pretty)
+
+
+def _json_loads(data: bytes) -> Any:
+    return _get_json_backend()[1](data)
+
+
+_YES = "y"
+"""Input confirming that a step is complete (see :meth:`Progress.wait_for_done`)."""
 
 
 @dataclass
@@ -26,6 +112,9 @@ class Progress(abc.ABC):
     all variables that track progress are included as attributes, and are
     serialisable to JSON; attributes beginning with `_` are excluded from the
     save/load functionality.
+
+    Subclasses are automatically made into dataclasses when defined, so must
+    NOT be decorated with ``@dataclass`` themselves.
     """
 
     latest_complete_step: int = -1
@@ -34,17 +123,40 @@ class Progress(abc.ABC):
     _dry_run: bool = False
     """If True, will only attempt instantiation, without saving or running get_steps."""
 
-    def __new__(cls, *args: Any, **kwargs: Any) -> "Progress":
+    _public_fields: ClassVar[tuple[str, ...]] = ()
+    """Names of the non-private dataclass attributes, which make up :attr:`state`."""
+
+    _validated: ClassVar[bool] = False
+    """True once a save file from this class has been shown to reload successfully."""
+
+    _save_suspended: bool = field(default=False, init=False, repr=False, compare=False)
+    """If True, :meth:`save` is deferred until the end of :meth:`_batched_saves`."""
+
+    _save_dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    """If True, an attribute was set while saving was suspended."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
         # It is essential to correct operation that cls itself is @dataclass
         #  decorated, not just inheriting decoration from a parent class.
         #  (Otherwise cls attributes will not be included in cls.__init__).
-        cls = dataclass(cls)
-        return super().__new__(cls)
+        #  Done once here, when the subclass is defined, not per instance.
+        super().__init_subclass__(**kwargs)
+        dataclass(cls)
+        cls._public_fields = tuple(
+            k for k in cls.__match_args__ if not k.startswith("_")
+        )
+        # Each subclass must validate its own save format.
+        cls._validated = False
 
     def __setattr__(self, key: Any, value: Any) -> None:
-        # Call :meth:`save` whenever an attribute is set.
+        # Call :meth:`save` whenever a non-private attribute is set (private
+        #  attributes are not part of :attr:`state`).
         super().__setattr__(key, value)
-        if not self._dry_run and self.ready:
+        if key.startswith("_") or self._dry_run or not self.ready:
+            return
+        if self._save_suspended:
+            self._save_dirty = True
+        else:
             self.save()
 
     def __post_init__(self) -> None:
@@ -54,12 +166,123 @@ class Progress(abc.ABC):
 
         file_stem = self._get_file_stem()
         self._logger = self._get_logger(file_stem)
-        self._file_path = file_stem.with_suffix(".json")
+        # The class name and steps cannot change, so neither can the comments.
+        self._comments_cached = self._save_file_comments
+        self._open_save_file(file_stem.with_suffix(".json"))
         self._logger.info(f"Progress will be saved to: {self._file_path}")
 
         self.save()
         self.run()
 
+    def _open_save_file(self, file_path: Path) -> None:
+        """Open (and truncate) the file that :meth:`save` writes to.
+
+        The file descriptor is held open until :meth:`_close_save_file`, and
+        each save rewrites the file in place through it, rather than
+        re-opening the file (see :meth:`_write_save_file`). Writes are made by
+        a background thread, so user input is never blocked on disk I/O; see
+        :meth:`flush`.
+        """
+        self._file_path = file_path
+        # O_BINARY prevents newline translation on Windows (absent elsewhere).
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        self._file_fd = os.open(file_path, flags, 0o644)
+        # Queue items: bytes to write, an Event to set once everything before
+        #  it is written, or None to stop.
+        self._write_queue: SimpleQueue[bytes | threading.Event | None] = SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name=f"nothing-{file_path.name}", daemon=True
+        )
+        self._writer.start()
+        # Fallback for runs that never reach the end of :meth:`run`.
+        atexit.register(self._close_save_file)
+
+    def _write_loop(self) -> None:
+        """Write queued save file content, on the background writer thread.
+
+        The save file only needs the latest state, so content that has been
+        superseded by the time it is reached is never written.
+        """
+        stop = False
+        while not stop:
+            items = [self._write_queue.get()]
+            while True:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except Empty:
+                    break
+
+            latest = None
+            events = []
+            for item in items:
+                if isinstance(item, bytes):
+                    latest = item
+                elif item is None:
+                    stop = True
+                else:
+                    events.append(item)
+
+            try:
+                if latest is not None:
+                    self._write_save_file(latest)
+                    self._last_json = latest
+                    self._logger.debug("Save complete.")
+            except OSError as exception:
+                # Re-raised by the next save() or flush().
+                self._write_error = exception
+            finally:
+                for event in events:
+                    event.set()
+
+    def _write_save_file(self, content: bytes) -> None:
+        """Replace the contents of the save file with ``content``.
+
+        Not atomic: an interruption part-way through can leave the file
+        incomplete. Not fsync'd: this is a progress record, and syncing on
+        every save would dominate the runtime.
+        """
+        os.lseek(self._file_fd, 0, os.SEEK_SET)
+        remaining = memoryview(content)
+        while remaining:
+            # os.write() may write fewer bytes than requested.
+            written = os.write(self._file_fd, remaining)
+            if written == 0:
+                message = f"Unable to write to {self._file_path}"
+                raise OSError(message)
+            remaining = remaining[written:]
+        os.ftruncate(self._file_fd, len(content))
+
+    def _close_save_file(self) -> None:
+        """Write any pending save, then stop the writer and close the file.
+
+        Any later :meth:`save` writes the file directly instead.
+        """
+        atexit.unregister(self._close_save_file)
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+            os.close(self._file_fd)
+
+    @contextmanager
+    def _batched_saves(self) -> Iterator[None]:
+        """Defer saving until the end of the block, then save at most once.
+
+        Nested blocks are absorbed into the outermost one.
+        """
+        if self._save_suspended:
+            yield
+            return
+
+        self._save_suspended = True
+        self._save_dirty = False
+        try:
+            yield
+        finally:
+            self._save_suspended = False
+            if self._save_dirty:
+                self._save_dirty = False
+                self.save()
+
     @staticmethod
     def _get_logger(file_stem: Path) -> logging.Logger:
         """Create a logger for informing the user and recording activity."""
@@ -73,7 +296,7 @@ class Progress(abc.ABC):
         file.setLevel(logging.DEBUG)
         logger.addHandler(file)
         # `console` allows a configurable level at which logging is also sent to STDOUT.
-        console = logging.StreamHandler(stdout)
+        console = logging.StreamHandler(sys.stdout)
         console.setFormatter(
             logging.Formatter(
                 "%(asctime)s %(message)s",
@@ -84,32 +307,89 @@ class Progress(abc.ABC):
 
         return logger
 
+    @staticmethod
+    @cache
+    def _get_nothing_dir(cwd: Path) -> Path:
+        """Create (if necessary) the directory for storing progress and logs.
+
+        Cached, so the directory is only checked once per working directory.
+        """
+        nothing_dir = cwd / ".nothing"
+        try:
+            nothing_dir.mkdir(exist_ok=True)
+        except FileExistsError as exception:
+            # Only raised by exist_ok=True if the path is not a directory.
+            message = f"{nothing_dir} exists but is not a directory."
+            raise RuntimeError(message) from exception
+        return nothing_dir
+
     @classmethod
-    def _get_file_stem(cls) -> Path:
+    def _get_file_stem(cls, name_override: Optional[str] = None) -> Path:
         """Create a date-stamped path for storing progress and logs.
 
-        Creates the parent directory if necessary.
+        Creates the parent directory if necessary. If ``name_override`` is
+        provided, it is used as the file stem instead of the date-stamped name.
         """
-        nothing_dir = Path().cwd() / ".nothing"
-        if nothing_dir.exists() and not nothing_dir.is_dir():
-            message = f"{nothing_dir} exists but is not a directory."
-            raise RuntimeError(message)
-        elif not nothing_dir.exists():
-            nothing_dir.mkdir()
+        nothing_dir = cls._get_nothing_dir(Path.cwd())
+        if name_override is not None:
+            return nothing_dir / name_override
+
+        from datetime import datetime
 
         date_time_string = datetime.now().strftime("%Y%m%d-%H%M%S")
         return nothing_dir / f"{cls.__name__}_{date_time_string}"
 
     @classmethod
-    def load(cls, file_path: Path, dry_run: bool = False) -> Self:
-        """Instantiate by loading a previous state from a saved file."""
-        kwargs = json.loads(file_path.read_text())
+    def load(cls, file_path: Path | dict[str, Any], dry_run: bool = False) -> Self:
+        """Instantiate by loading a previous state from a saved file.
+
+        Parameters
+        ----------
+        file_path : Path or dict
+            The path of the saved file. Alternatively the file's already-parsed
+            contents, e.g. to validate content without writing it to disk.
+        dry_run : bool, default=False
+            See :attr:`_dry_run`.
+
+        """
+        if isinstance(file_path, dict):
+            kwargs = dict(file_path)
+        else:
+            kwargs = _json_loads(file_path.read_bytes())
         del kwargs["comments"]
         return cls(_dry_run=dry_run, **kwargs)
 
+    @classmethod
+    def validate_roundtrip(cls, file_path: Path | dict[str, Any]) -> None:
+        """Check that a saved file can be successfully reloaded via :meth:`load`.
+
+        Raises ``ValueError`` if not. The save format cannot change during a
+        run, so :meth:`save` only calls this for the first save of each class,
+        passing the parsed contents rather than re-reading the file.
+
+        Parameters
+        ----------
+        file_path : Path or dict
+            The path of the saved file, or its already-parsed contents (see
+            :meth:`load`).
+
+        """
+        try:
+            _ = cls.load(file_path, dry_run=True)
+        except Exception as exception:
+            message = (
+                f"{cls.__name__} instance saves to an "
+                f"unloadable file - exception below:\n\n{exception}"
+            )
+            raise ValueError(message) from exception
+        cls._validated = True
+
     @classmethod
     def main(cls) -> None:
         """Command-line interface for the do-nothing workflow."""
+        # Only imported here; not needed when using the class programmatically.
+        from argparse import ArgumentParser
+
         parser = ArgumentParser(
             description=cls.get_cmd_description(),
         )
@@ -129,45 +409,66 @@ class Progress(abc.ABC):
             ),
         }
 
-        new, load, template = [
-            subparsers.add_parser(name=name, help=helps[name], description=helps[name])
-            for name in helps
-        ]
+        def add_new(new: ArgumentParser) -> None:
+            new.set_defaults(func=lambda _: cls())
 
-        load.add_argument(
-            "file_path",
-            type=Path,
-            help="The path of the JSON progress file to be loaded.",
-        )
+        def add_load(load: ArgumentParser) -> None:
+            load.add_argument(
+                "file_path",
+                type=Path,
+                help="The path of the JSON progress file to be loaded.",
+            )
+            load.set_defaults(func=lambda p: cls.load(p.file_path))
+
+        def add_template(template: ArgumentParser) -> None:
+            template.set_defaults(func=lambda _: create_template_file())
 
         def create_template_file() -> None:
             instance = cls(_dry_run=True)
             instance._logger = logging.getLogger("nothing")
-            instance._file_path = cls._get_file_stem().with_name(
-                f"{cls.__name__}_template.json"
-            )
-            instance.save()
+            instance._comments_cached = instance._save_file_comments
+            file_stem = cls._get_file_stem(name_override=f"{cls.__name__}_template")
+            instance._open_save_file(file_stem.with_suffix(".json"))
+            # Templates are intended for manual editing.
+            instance.save(pretty=True)
+            instance.flush()
+            instance._close_save_file()
+            cls.validate_roundtrip(instance._file_path)
             print(f"Template saved to: {instance._file_path}")
 
-        new.set_defaults(func=lambda _: cls())
-        load.set_defaults(func=lambda p: cls.load(p.file_path))
-        template.set_defaults(func=lambda _: create_template_file())
+        setups = {"new": add_new, "load": add_load, "template": add_template}
+
+        # Only build the parser for the requested subcommand. If none is
+        #  recognised, or top-level help is requested before it, parsing can
+        #  only end in help or an error, so build bare parsers for all
+        #  subcommands to be listed.
+        args = sys.argv[1:]
+        requested = None
+        for arg in args:
+            if arg in ("-h", "--help"):
+                break
+            if not arg.startswith("-"):
+                requested = arg
+                break
+        if requested in helps:
+            subparser = subparsers.add_parser(
+                name=requested, help=helps[requested], description=helps[requested]
+            )
+            setups[requested](subparser)
+        else:
+            for name in helps:
+                subparsers.add_parser(
+                    name=name, help=helps[name], description=helps[name]
+                )
 
-        parsed = parser.parse_args()
+        parsed = parser.parse_args(args)
         parsed.func(parsed)
 
     @property
     def ready(self) -> bool:
         """Return True once the essential attributes have been set."""
-        return all(
-            [
-                k in self.__dict__
-                for k in (
-                    "_logger",
-                    "_file_path",
-                )
-            ]
-        )
+        # Called on every attribute set, so avoid building a list.
+        return "_logger" in self.__dict__ and "_file_path" in self.__dict__
 
     @property
     def state(self) -> dict[str, Any]:
@@ -177,33 +478,31 @@ class Progress(abc.ABC):
         workflow and track its progress. They are the values that are required
         for recreating the instance e.g. via :meth:`load`.
         """
-        return {
-            k: self.__dict__[k] for k in self.__match_args__ if not k.startswith("_")
-        }
+        return {k: self.__dict__[k] for k in self._public_fields}
 
     @property
-    def _save_file_comments(self) -> list[list[str]]:
+    def _save_file_comments(self) -> list[str]:
         """Comments that will be stored, but not loaded, in the save file.
 
-        Each comment is ``list[str]`` as a JSON-compatible way to store
-        multiline strings.
+        Each comment is a single string, with lines separated by ``\\n``.
         """
-        comments: list[list[str]] = []
+        comment_lines: list[list[str]] = []
         cls_name = self.__class__.__name__
-        comments.append(
+        comment_lines.append(
             [
                 f"This file stores the progress of the {cls_name} do-nothing workflow.",
                 "It can be loaded to resume progress, and edited to resume from",
                 "an alternative step or use alternative values.",
+                "These comments are ignored when loading.",
             ]
         )
-        comments.append(
+        comment_lines.append(
             [
                 "Step names:",
                 *[f"{ix}: {step.__name__}" for ix, step in enumerate(self.get_steps())],
             ]
         )
-        return comments
+        return ["\n".join(lines) for lines in comment_lines]
 
     def run(self) -> None:
         """Iteratively run the functions in :meth:`get_steps`.
@@ -213,35 +512,79 @@ class Progress(abc.ABC):
         """
 
         index_first = self.latest_complete_step + 1
-        for step in self.get_steps()[index_first:]:
-            index_current = self.latest_complete_step + 1
-            self.print("")
-            self._logger.info(f"*** STEP {index_current} STARTING ***")
-            step(self=self)
-            self._logger.info(f"*** STEP {index_current} COMPLETE ***")
-            self.latest_complete_step = index_current
+        try:
+            for step in self.get_steps()[index_first:]:
+                index_current = self.latest_complete_step + 1
+                with self._batched_saves():
+                    self.print("")
+                    self._logger.info(f"*** STEP {index_current} STARTING ***")
+                    step(self=self)
+                    self._logger.info(f"*** STEP {index_current} COMPLETE ***")
+                    self.latest_complete_step = index_current
+            self.flush()
+        finally:
+            self._close_save_file()
         self._logger.info("*** WORKFLOW COMPLETE ***")
 
-    def save(self) -> None:
+    def save(self, pretty: bool = False) -> None:
         """Save :attr:`state` to a JSON file, enabling later reloading.
 
-        Includes validation that the saved file can be successfully reloaded.
+        The file is written in the background; use :meth:`flush` to wait for
+        it. Skipped if the file already holds an identical state. The first
+        save of each class is validated using :meth:`validate_roundtrip`.
+        Raises any error from a previous background write.
+
+        Parameters
+        ----------
+        pretty : bool, default=False
+            Indent the JSON for easier reading and editing. Otherwise the JSON
+            is compact, which is smaller and faster to write.
+
         """
-        self._logger.debug(f"Saving state: {self.state}")
-        save_dict = dict(comments=self._save_file_comments) | self.state
-        json_rep = json.dumps(save_dict, indent=2)
-        Path(self._file_path).write_text(json_rep)
-        self._logger.debug("Save complete.")
+        self._raise_write_error()
+        state = self.state
+        save_dict = dict(comments=self._comments_cached) | state
+        json_rep = _json_dumps(save_dict, pretty=pretty)
+        # Only skip if identical content has been written, and nothing
+        #  different is still waiting to be written over it.
+        last_written = self.__dict__.get("_last_json")
+        if json_rep == last_written == self.__dict__.get("_last_queued"):
+            return
 
-        try:
-            _ = self.__class__.load(self._file_path, dry_run=True)
-        except Exception as exception:
-            message = (
-                f"{self.__class__.__name__} instance saves to an "
-                f"unloadable file - exception below:\n\n{exception}"
-            )
-            self._logger.error(message)
-            raise ValueError(message)
+        # Avoid formatting the state unless it will actually be logged.
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Saving state: %r", state)
+        if self._writer.is_alive():
+            self._write_queue.put(json_rep)
+        else:
+            Path(self._file_path).write_bytes(json_rep)
+            self._last_json = json_rep
+        self._last_queued = json_rep
+
+        if not type(self)._validated:
+            try:
+                self.validate_roundtrip(_json_loads(json_rep))
+            except ValueError as exception:
+                self._logger.error(str(exception))
+                raise
+
+    def flush(self) -> None:
+        """Wait until all previous calls to :meth:`save` have been written.
+
+        Raises any error from a background write.
+        """
+        if self._writer.is_alive():
+            done = threading.Event()
+            self._write_queue.put(done)
+            done.wait()
+        self._raise_write_error()
+
+    def _raise_write_error(self) -> None:
+        """Raise (once) any error from the background writer thread."""
+        exception = self.__dict__.pop("_write_error", None)
+        if exception is not None:
+            self._logger.error(f"Failed to save progress: {exception}")
+            raise exception
 
     @classmethod
     @abc.abstractmethod
@@ -273,14 +616,13 @@ class Progress(abc.ABC):
     def wait_for_done(message: str) -> None:
         """Print a message, then wait for user confirmation to proceed."""
         Progress.print(message)
-        done = False
-        while not done:
-            done = input("Step complete? y / [n] : ").casefold() == "y".casefold()
+        while input("Step complete? y / [n] : ").strip().lower() != _YES:
+            pass
 
     @staticmethod
     def report_problem(message: str) -> None:
         """Print a message to STDERR, then wait 0.5secs."""
-        print(message, file=stderr)
+        print(message, file=sys.stderr)
         # To ensure correct sequencing of messages.
         sleep(0.5)
 
@@ -316,20 +658,25 @@ class Progress(abc.ABC):
 
         default = getattr(self, key, None)
         input_final = None
-        while input_final is None:
-            if default is not None:
-                expected_inputs_final = (
-                    f"{expected_inputs}\nOR input nothing for `{default}`"
-                )
-            else:
-                expected_inputs_final = expected_inputs
-            input_new = Progress.get_input(message, expected_inputs_final)
-            if input_new == "":
-                input_final = default
-            else:
-                input_final = post_process(input_new)
+        with self._batched_saves():
+            while input_final is None:
+                if default is not None:
+                    expected_inputs_final = (
+                        f"{expected_inputs}\nOR input nothing for `{default}`"
+                    )
+                else:
+                    expected_inputs_final = expected_inputs
+                input_new = Progress.get_input(message, expected_inputs_final)
+                if input_new == "":
+                    input_final = default
+                else:
+                    input_final = post_process(input_new)
+
+            self.__setattr__(key, input_final)
 
-        self.__setattr__(key, input_final)
+
+_DEMO_VAR_2_CHOICES = frozenset({"A", "B", "C"})
+"""Inputs accepted for :attr:`Demo.var_2` (see :meth:`Demo.set_var_2`)."""
 
 
 class Demo(Progress):
@@ -341,6 +688,8 @@ class Demo(Progress):
         return "Demo workflow for nothing.py"
 
     def set_var_1(self) -> None:
+        from datetime import datetime
+
         self.var_1 = datetime.now().day
 
     def set_var_2(self) -> None:
@@ -348,7 +697,7 @@ class Demo(Progress):
             key="var_2",
             message="Input a string",
             expected_inputs="Either A or B or C",
-            post_process=lambda x: x if x in ["A", "B", "C"] else None,
+            post_process=lambda x: x if x in _DEMO_VAR_2_CHOICES else None,
         )
 
     @classmethod